@@ -1,4 +1,6 @@
 import asyncio
+import concurrent.futures
+import functools
 from typing import Any, ClassVar, Dict, List, Mapping, Optional, Sequence
 
 from typing_extensions import Self
@@ -10,7 +12,7 @@ from viam.proto.common import Geometry, ResourceName
 from viam.resource.base import ResourceBase
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import SensorReading, ValueTypes, struct_to_dict
+from viam.utils import SensorReading, ValueTypes
 
 import time
 import board as pyboard
@@ -18,6 +20,19 @@ import adafruit_hcsr04
 
 LOGGER = getLogger("ultrasonic-adafruit")
 
+# Config attribute keys, read straight off config.attributes.fields so we
+# skip the full Struct → dict materialization on every (re)configure.
+_TRIGGER = "trigger_pin"
+_ECHO = "echo_interrupt_pin"
+_TIMEOUT = "timeout_ms"
+
+# Hot-path bindings for get_readings: pre-bound method and constants avoid
+# global/attribute lookups and f-string builds on every sample.
+_LOG_ERR = LOGGER.error
+_SCALE = 0.01  # cm to meters
+_FAIL = {"distance": -1.0}
+_READ_TTL = 0.02  # seconds; overlapping readers within this window share one pulse
+
 # Mapping of physical pin numbers (as strings) to BCM → board.Dxx
 BOARD_TO_BCM = {
     "3": 2, "5": 3, "7": 4, "8": 14, "10": 15, "11": 17, "12": 18,
@@ -26,7 +41,119 @@ BOARD_TO_BCM = {
     "32": 12, "33": 13, "35": 19, "36": 16, "37": 26, "38": 20, "40": 21
 }
 
+def _build_pin_table() -> Dict[str, Any]:
+    """Precompute every supported pin spelling → board.Dxx object.
+
+    Built once at import so _resolve_pin is a single dict lookup instead of
+    string parsing + getattr on every reconfigure. Dxx/GPIOxx/raw-BCM
+    spellings come from every Dxx attribute the board module exposes (so
+    e.g. D0/D1 stay valid even though no physical header pin maps to them);
+    physical pin numbers are added last so they win on collisions (e.g. "3"
+    means physical pin 3, not BCM 3), matching the old branch order.
+    """
+    table: Dict[str, Any] = {}
+    for name in dir(pyboard):
+        if name[:1] == "D" and name[1:].isdigit():
+            pin = getattr(pyboard, name)
+            bcm = name[1:]
+            table[bcm] = pin
+            table[name] = pin
+            table[f"GPIO{bcm}"] = pin
+    for phys, bcm in BOARD_TO_BCM.items():
+        pin = getattr(pyboard, f"D{bcm}", None)
+        if pin is not None:
+            table[phys] = pin
+    return table
+
+PIN_TABLE = _build_pin_table()
+
+@functools.lru_cache(maxsize=None)
+def _resolve_pin(pin_str: str):
+    """Resolve a pin string into a board.Dxx object via PIN_TABLE.
+
+    Supports:
+    - Physical pin numbers (e.g., '16')
+    - D-formatted strings (e.g., 'D23')
+    - GPIO-formatted strings (e.g., 'GPIO23')
+    - BCM numbers (e.g., '23')
+
+    Cached so repeated reconfigures with the same pins skip the lookup and
+    log call entirely.
+    """
+    pin = PIN_TABLE.get(pin_str)
+    if pin is None:
+        raise ValueError(f"Invalid pin format: {pin_str}. Use physical pin (e.g. '16'), D23, GPIO23, or BCM number.")
+    LOGGER.info("Resolved pin %s → %s", pin_str, pin)
+    return pin
+
+# When Blinka's pulseio backend is available (it is on Raspberry Pi), the
+# library constructs the echo line as a PulseIn, which times the pulse out of
+# process and exposes no .value attribute — our bit-banged loop only applies
+# to the DigitalInOut fallback.
+_USE_PULSEIO = getattr(adafruit_hcsr04, "_USE_PULSEIO", False)
+
+class _HCSR04(adafruit_hcsr04.HCSR04):
+    """HCSR04 that times the echo pulse with time.monotonic_ns().
+
+    Integer-nanosecond compares are cheaper than float compares and avoid
+    the float-epsilon jitter of monotonic()-based timing, which matters for
+    the very short pulses of near-range readings. Only the bit-banged
+    DigitalInOut path is overridden; with pulseio the pulse is already
+    timed natively and the library's own path is used.
+    """
+
+    def __init__(self, trigger_pin, echo_pin, timeout_ns: int):
+        super().__init__(
+            trigger_pin=trigger_pin, echo_pin=echo_pin, timeout=timeout_ns / 1e9
+        )
+        self._timeout_ns = timeout_ns
+
+    def _dist_two_wire(self):
+        if _USE_PULSEIO:
+            # self._echo is a PulseIn here, not a DigitalInOut.
+            return super()._dist_two_wire()
+
+        self._trig.value = True
+        time.sleep(0.00001)  # 10 µs trigger pulse
+        self._trig.value = False
+
+        monotonic_ns = time.monotonic_ns
+        timeout_ns = self._timeout_ns
+        echo = self._echo
+
+        start = monotonic_ns()
+        while not echo.value:  # wait for echo to go high
+            if monotonic_ns() - start > timeout_ns:
+                raise RuntimeError("Timed out")
+        start = monotonic_ns()
+        while echo.value:  # wait for echo to go low
+            if monotonic_ns() - start > timeout_ns:
+                raise RuntimeError("Timed out")
+
+        pulse_us = (monotonic_ns() - start) / 1000.0
+        if pulse_us >= 65535:
+            raise RuntimeError("Timed out")
+
+        # Speed of sound is ~0.0343 cm/µs; halve for the round trip.
+        return (pulse_us * 0.0343) / 2
+
+
 class UltrasonicAdafruit(Sensor, EasyResource):
+    # The viam base classes still carry __dict__, but slotting our own
+    # attributes makes access to them (notably self.sonar in get_readings)
+    # a fixed-offset load instead of a dict probe.
+    __slots__ = (
+        "sonar",
+        "trigger_pin",
+        "echo_interrupt_pin",
+        "_distance_fget",
+        "_timeout_ns",
+        "_sonar_key",
+        "_read_lock",
+        "_last",
+        "_executor",
+    )
+
     MODEL: ClassVar[Model] = Model(
         ModelFamily("joyce", "ultrasonic-adafruit"), "ultrasonic-adafruit"
     )
@@ -37,81 +164,81 @@ class UltrasonicAdafruit(Sensor, EasyResource):
     ) -> Self:
         return super().new(config, dependencies)
 
-    def _resolve_pin(self, pin_str: str):
-        """Resolve a pin string into a board.Dxx object.
-
-        Supports:
-        - Physical pin numbers (e.g., '16')
-        - D-formatted strings (e.g., 'D23')
-        - GPIO-formatted strings (e.g., 'GPIO23')
-        - BCM numbers (e.g., '23')
-        """
-        attr = None
-
-        # Physical pin number
-        if pin_str in BOARD_TO_BCM:
-            bcm = BOARD_TO_BCM[pin_str]
-            attr = f"D{bcm}"
-            LOGGER.info(f"Resolved physical pin {pin_str} → BCM {bcm} → board.{attr}")
-
-        # Dxx format (e.g. D23)
-        elif pin_str.startswith("D") and pin_str[1:].isdigit():
-            attr = pin_str
-            LOGGER.info(f"Using direct board constant: board.{attr}")
-
-        # GPIO format (e.g. GPIO23)
-        elif pin_str.startswith("GPIO") and pin_str[4:].isdigit():
-            attr = f"D{pin_str[4:]}"
-            LOGGER.info(f"Resolved {pin_str} → board.{attr}")
-
-        # Raw BCM (e.g. "23")
-        elif pin_str.isdigit():
-            attr = f"D{pin_str}"
-            LOGGER.info(f"Assuming BCM {pin_str} → board.{attr}")
-
-        else:
-            raise ValueError(f"Invalid pin format: {pin_str}. Use physical pin (e.g. '16'), D23, GPIO23, or BCM number.")
-
-        try:
-            return getattr(pyboard, attr)
-        except AttributeError:
-            raise ValueError(f"{attr} is not available on this board module")
-
     @classmethod
     def validate_config(cls, config: ComponentConfig) -> Sequence[str]:
-        attrs = struct_to_dict(config.attributes)
-        required_attributes = ["echo_interrupt_pin", "trigger_pin"]
-        for attr in required_attributes:
-            if attr not in attrs or not isinstance(attrs[attr], str):
+        fields = config.attributes.fields
+        for attr in (_ECHO, _TRIGGER):
+            if attr not in fields or fields[attr].WhichOneof("kind") != "string_value":
                 raise ValueError(f"{attr} is required and must be a string")
+        if _TIMEOUT in fields and fields[_TIMEOUT].WhichOneof("kind") != "number_value":
+            raise ValueError(f"{_TIMEOUT} must be a number")
         return []
 
     def reconfigure(
         self, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
     ):
-        attrs = struct_to_dict(config.attributes)
+        fields = config.attributes.fields
+
+        # The HC-SR04 can't be pulsed concurrently (crosstalk), so readers
+        # serialize on a lock and share recent measurements via _last.
+        if getattr(self, "_read_lock", None) is None:
+            self._read_lock = asyncio.Lock()
+            self._last = (0.0, -1.0)
+            # Single worker so reads stay ordered and never overlap on the
+            # sensor, while the event loop keeps servicing other coroutines.
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="hcsr04"
+            )
 
         try:
-            trigger_pin_str = str(attrs.get("trigger_pin"))
-            echo_pin_str = str(attrs.get("echo_interrupt_pin"))
-            timeout_sec = float(attrs.get("timeout_ms", 1000)) / 1000.0
+            trigger_pin_str = fields[_TRIGGER].string_value
+            echo_pin_str = fields[_ECHO].string_value
+            # number_value reads as 0.0 for non-number kinds, which would make
+            # every read time out instantly; only trust an actual number.
+            if _TIMEOUT in fields and fields[_TIMEOUT].WhichOneof("kind") == "number_value":
+                timeout_ms = fields[_TIMEOUT].number_value
+            else:
+                timeout_ms = 1000.0
+            self._timeout_ns = int(timeout_ms * 1_000_000)
 
-            trigger_pin = self._resolve_pin(trigger_pin_str)
-            echo_pin = self._resolve_pin(echo_pin_str)
+            # Rebuilding the HCSR04 re-acquires the GPIO lines, which is
+            # slow and can glitch the trigger; skip it when nothing changed.
+            key = (trigger_pin_str, echo_pin_str, self._timeout_ns)
+            if getattr(self, "_sonar_key", None) == key:
+                return super().reconfigure(config, dependencies)
 
-            self.sonar = adafruit_hcsr04.HCSR04(
+            trigger_pin = _resolve_pin(trigger_pin_str)
+            echo_pin = _resolve_pin(echo_pin_str)
+
+            old_sonar = getattr(self, "sonar", None)
+            if old_sonar is not None:
+                # Drop our references before deinit so that if constructing
+                # the replacement fails (e.g. the new GPIO line is busy) we
+                # degrade to the uninitialized state in _read_one instead of
+                # reading a dead pin object, and a stale key can't block a
+                # rebuild when the config is reverted.
+                self.sonar = None
+                self._sonar_key = None
+                old_sonar.deinit()
+
+            self.sonar = _HCSR04(
                 trigger_pin=trigger_pin,
                 echo_pin=echo_pin,
-                timeout=timeout_sec
+                timeout_ns=self._timeout_ns
             )
+            self._sonar_key = key
 
             self.trigger_pin = trigger_pin_str
             self.echo_interrupt_pin = echo_pin_str
 
+            # Bind the distance getter once so get_readings skips the
+            # descriptor lookup on every sample.
+            self._distance_fget = _HCSR04.distance.fget
+
             LOGGER.info("Adafruit HCSR04 initialized successfully")
 
         except Exception as e:
-            LOGGER.error(f"Failed to initialize HCSR04: {e}")
+            LOGGER.error("Failed to initialize HCSR04: %s", e)
 
         return super().reconfigure(config, dependencies)
 
@@ -122,12 +249,51 @@ class UltrasonicAdafruit(Sensor, EasyResource):
         timeout: Optional[float] = None,
         **kwargs
     ) -> Mapping[str, SensorReading]:
-        try:
-            distance = self.sonar.distance / 100.0  # cm to meters
-            return {"distance": distance}
-        except Exception as e:
-            LOGGER.error(f"Ultrasonic sensor read failed: {e}")
-            return {"distance": -1.0}
+        # Serve overlapping callers from the last measurement when it is
+        # fresh enough, so one physical pulse satisfies all of them.
+        ts, val = self._last
+        if time.monotonic() - ts < _READ_TTL:
+            return {"distance": val}
+
+        async with self._read_lock:
+            ts, val = self._last
+            if time.monotonic() - ts < _READ_TTL:
+                return {"distance": val}
+
+            # The read busy-waits on GPIO for up to the configured timeout;
+            # run it on the executor so the event loop isn't held hostage.
+            loop = asyncio.get_running_loop()
+            distance = await loop.run_in_executor(self._executor, self._read_one)
+            self._last = (time.monotonic(), distance)
+            if distance > 0:
+                return {"distance": distance}
+            return _FAIL
+
+    def _read_one(self) -> float:
+        """Blocking HC-SR04 read with retries; runs on the executor thread.
+
+        HC-SR04 reads past ~1 m fail often, so make up to 3 attempts with a
+        short gap. Returns the distance in meters, or -1.0 on failure.
+        """
+        # reconfigure swallows init failures and close() drops the sensor;
+        # degrade to -1.0 here instead of leaking AttributeError to callers.
+        sonar = getattr(self, "sonar", None)
+        if sonar is None:
+            _LOG_ERR("Ultrasonic sensor read failed: sensor is not initialized")
+            return -1.0
+        read = self._distance_fget
+        last_error = None
+        for attempt in range(3):
+            if attempt:
+                time.sleep(0.002)
+            try:
+                distance = read(sonar) * _SCALE  # cm to meters
+                if distance > 0:
+                    return distance
+            except Exception as e:
+                last_error = e
+        _LOG_ERR("Ultrasonic sensor read failed: %s", last_error)
+        return -1.0
 
     async def do_command(
         self,
@@ -144,10 +310,21 @@ class UltrasonicAdafruit(Sensor, EasyResource):
         raise NotImplementedError()
 
     async def close(self):
-        pass
-
-    def __del__(self):
-        pass
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        sonar = getattr(self, "sonar", None)
+        if sonar is not None:
+            sonar.deinit()
+            self.sonar = None
+            self._sonar_key = None
 
 if __name__ == "__main__":
+    try:
+        # uvloop's C event loop has lower per-wakeup overhead than stock
+        # asyncio; use it when available, fall back silently otherwise.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(Module.run_from_registry())
\ No newline at end of file